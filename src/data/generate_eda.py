@@ -6,7 +6,7 @@ Generates EDA, tables and plots the pre-processed training data from the Custome
 (from https://files.consumerfinance.gov/ccdb/complaints.csv.zip) and saves the plots as pdf and png files
 Usage: src/generate_eda.py --train=<train> [--out_dir=<out_dir>]
 Options:
---train=<train>          Path (including filename) to training data (saved as csv)
+--train=<train>          Path (including filename) to training data (saved as parquet, arrow ipc stream or csv)
 --out_dir=<out_dir>      Path to directory where the plots should be saved, optional
 """
 
@@ -17,6 +17,11 @@ import os
 import pandas as pd
 import numpy as np
 import altair as alt
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import warnings
 warnings.filterwarnings("ignore")
 
@@ -35,16 +40,56 @@ from src.data.load_preprocess_data import load_processed_complaints_data
 # function that saves the table as a csv file
 def save_table(table, table_name):
     """
-    Saves the dataframe passed as a csv
+    Saves the dataframe passed as a csv with the arrow csv writer
 
     Args:
         table (pd.dataframe): dataframe to be saved as csv
+        table_name (string): file name of the csv, without the extension
     """
-    table.to_csv(
+    pa_csv.write_csv(
+        pa.Table.from_pandas(table, preserve_index=False),
         os.path.join(os.getcwd(), "reports", "assets", "tables", f"{table_name}.csv"),
-        index=False,
     )
 
+# function that counts the valid and unique values of a column
+def count_valid_unique(column):
+    """
+    Counts the valid and unique values of a column in arrow, the
+    counts match pandas count() and nunique()
+
+    Args:
+        column (pyarrow.ChunkedArray or pd.Series): column to count,
+            data frame columns arrow can't convert are counted in pandas
+
+    Returns:
+        tuple: 
+            The number of valid values and of unique valid values
+    """
+
+    if isinstance(column, pd.Series):
+        try:
+            column = pa.Table.from_pandas(
+                column.to_frame(), preserve_index=False
+            ).column(0)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # such as object columns holding mixed types
+            return column.count(), column.nunique()
+
+    valid_count = pc.count(column).as_py()
+
+    # columns without any values are read in with the null type
+    if pa.types.is_null(column.type):
+        return valid_count, 0
+
+    if pa.types.is_dictionary(column.type):
+        # categories, count the distinct codes across a shared dictionary
+        column = column.unify_dictionaries()
+        column = pa.chunked_array(
+            [chunk.indices for chunk in column.chunks], type=column.type.index_type
+        )
+
+    return valid_count, pc.count_distinct(column).as_py()
+
 # function that returns the unique and null table
 def gen_unique_null_table(complaints_df):
     """
@@ -52,19 +97,81 @@ def gen_unique_null_table(complaints_df):
     the columns and the data fields
 
     Args:
-        complaints_df (pd.DataFrame()): 
-            The processed dataframe
+        complaints_df (pd.DataFrame(), pyarrow.Table or pyarrow.dataset.Dataset): 
+            The processed dataframe, an arrow table such as a memory mapped
+            file, or a dataset of the processed file which is counted one
+            column at a time without loading it all
 
     Returns:
         pd.DataFrame(): 
             Data frame with unique and null values of the columns
     """
 
-    unique_df = pd.DataFrame()
-    unique_df["columns"] = complaints_df.columns
-    unique_df["valid_count"] = complaints_df.count(axis=0).reset_index()[0]
-    unique_df["unique_count"] = complaints_df.nunique().reset_index()[0]
-    return unique_df
+    if isinstance(complaints_df, ds.Dataset):
+        columns = (
+            (col, complaints_df.to_table(columns=[col]).column(0))
+            for col in complaints_df.schema.names
+        )
+    elif isinstance(complaints_df, pa.Table):
+        columns = zip(complaints_df.column_names, complaints_df.columns)
+    else:
+        columns = complaints_df.items()
+
+    counts = []
+    for col, column in columns:
+        valid_count, unique_count = count_valid_unique(column)
+        counts.append(
+            {"columns": col, "valid_count": valid_count, "unique_count": unique_count}
+        )
+
+    return pd.DataFrame(counts, columns=["columns", "valid_count", "unique_count"])
+
+# function that reads only the last rows of the processed data
+def read_last_complaints(train, num_complaints):
+    """
+    Reads the last complaints of the processed file, only the parquet
+    row groups holding those complaints are read from disk and arrow
+    ipc streams are memory mapped
+
+    Args:
+        train (string): path of the processed parquet or arrow ipc file
+
+        num_complaints (int):
+            Number of complaints to read from the end of the file
+
+    Returns:
+        pd.DataFrame(): 
+            The last complaints, indexed by their row in the file
+    """
+
+    if train.endswith(".arrows"):
+        table = pa.ipc.open_stream(pa.memory_map(train, "r")).read_all()
+        total_rows = table.num_rows
+    elif not train.endswith(".parquet"):
+        raise ValueError(f"Expected a .parquet or .arrows file, got {train}")
+    else:
+        parquet_file = pq.ParquetFile(train)
+        total_rows = parquet_file.metadata.num_rows
+
+        row_groups = []
+        num_rows = 0
+        for i in reversed(range(parquet_file.num_row_groups)):
+            row_groups.insert(0, i)
+            num_rows += parquet_file.metadata.row_group(i).num_rows
+            if num_rows >= num_complaints:
+                break
+
+        table = parquet_file.read_row_groups(row_groups)
+
+    table = table.slice(max(table.num_rows - num_complaints, 0))
+
+    # arrow backed strings so isna reads the validity bitmap
+    recent_df = table.to_pandas(
+        ignore_metadata=True,
+        types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get,
+    )
+    recent_df.index = pd.RangeIndex(total_rows - len(recent_df), total_rows)
+    return recent_df
 
 # function that plots and returns the missing values
 def plot_missing_values(complaints_df, num_complaints):
@@ -83,22 +190,24 @@ def plot_missing_values(complaints_df, num_complaints):
             Plots missing values in the dataframe
     """
 
-    alt.data_transformers.enable("data_server")
-    na_val_df = (
-        complaints_df.tail(num_complaints).isna().reset_index().melt(id_vars="index")
-    )
-    last_date = (
-        complaints_df.date_received.tail(num_complaints).max().strftime("%m/%d/%Y")
-    )
-    first_date = (
-        complaints_df.date_received.tail(num_complaints).min().strftime("%m/%d/%Y")
+    recent_df = complaints_df.tail(num_complaints)
+    recent_dates = recent_df["date_received"]
+    first_date = recent_dates.min().strftime("%m/%d/%Y")
+    last_date = recent_dates.max().strftime("%m/%d/%Y")
+
+    # long form of the missing value mask, built column by column like melt
+    missing = recent_df.isna().to_numpy()
+    num_rows, num_cols = missing.shape
+    missing_df = pd.DataFrame(
+        {
+            "index": np.tile(recent_df.index.to_numpy(), num_cols),
+            "variable": np.repeat(recent_df.columns.to_numpy(), num_rows),
+            "value": missing.ravel(order="F"),
+        }
     )
     missing_vals = (
         alt.Chart(
-            complaints_df.tail(num_complaints)
-            .isna()
-            .reset_index()
-            .melt(id_vars="index"),
+            missing_df,
             title=f"Missing Values of {num_complaints} Complaints: {first_date} - {last_date}",
         )
         .mark_rect()
@@ -109,7 +218,7 @@ def plot_missing_values(complaints_df, num_complaints):
             alt.Stroke("value", scale=alt.Scale(scheme="dark2"))
             # We set the stroke which is the outline of each rectangle in the heatmap
         )
-        .properties(width=min(500, complaints_df.tail(num_complaints).shape[0]))
+        .properties(width=min(500, num_rows))
     )
 
     return missing_vals
@@ -128,11 +237,24 @@ def plot_complaints_over_time(complaints_df):
             Plot of complaints over time
     """
 
-    num_complaints = (
-        complaints_df.resample("M", on="date_received")
-        .agg({"date_received": "size"})
-        .rename(columns={"date_received": "num_complaints"})
-        .reset_index()
+    # count complaints per month on integer month bins, labelled by the last day
+    # of each month with empty months kept like a monthly resample
+    months = complaints_df["date_received"].to_numpy().astype("datetime64[M]")
+    months = months[~np.isnat(months)]
+    if len(months) > 0:
+        first_month = months.min()
+        counts = np.bincount((months - first_month).astype(np.int64))
+        month_starts = first_month + np.arange(len(counts))
+    else:
+        # no dates to count, an empty frame like the resample of no dates
+        counts = np.zeros(0, dtype=np.int64)
+        month_starts = months
+    month_ends = (month_starts + 1).astype("datetime64[D]") - 1
+    num_complaints = pd.DataFrame(
+        {
+            "date_received": month_ends.astype("datetime64[ns]"),
+            "num_complaints": counts,
+        }
     )
     complaints_over_time = (
         alt.Chart(num_complaints, title="Monthly Complaints are Spiking in 2022")
@@ -185,10 +307,31 @@ def main(train, out_dir):
 
     if out_dir is None:
         out_dir = os.path.join("results", "assets")
-    complaints_df = load_processed_complaints_data(train)
+
+    if train.endswith(".csv"):
+        # csv files can't be read by column or row group, so the whole
+        # file is loaded once and used for every output
+        complaints_df = load_processed_complaints_data(train)
+        complaints_data = complaints_df
+    elif train.endswith((".parquet", ".arrows")):
+        # only the columns used for plots 2 and 3 are loaded in full
+        complaints_df = load_processed_complaints_data(
+            train, columns=["date_received", "consumer_disputed"]
+        )
+
+        # Table 1 is counted in arrow, arrow ipc streams are memory mapped
+        # and parquet files are read one column at a time
+        if train.endswith(".arrows"):
+            complaints_data = pa.ipc.open_stream(pa.memory_map(train, "r")).read_all()
+        else:
+            complaints_data = ds.dataset(train, format="parquet")
+    else:
+        raise ValueError(
+            f"Expected the train data as a .parquet, .arrows or .csv file, got {train}"
+        )
 
     # Table 1: Generates the unique and valid values
-    unique_df = gen_unique_null_table(complaints_df)
+    unique_df = gen_unique_null_table(complaints_data)
 
     # Saving the generated table
     print("Saving the Table in the assets->tables folder")
@@ -199,7 +342,11 @@ def main(train, out_dir):
     # Plot 1: Generating Missing Values Plot
     print("Generating missing values plot")
     num_complaints = 2000
-    missing_vals = plot_missing_values(complaints_df, num_complaints)
+    if train.endswith(".csv"):
+        recent_df = complaints_df.tail(num_complaints)
+    else:
+        recent_df = read_last_complaints(train, num_complaints)
+    missing_vals = plot_missing_values(recent_df, num_complaints)
     print("Plot Generated")
 
     # Saving the missing values plot
@@ -4,19 +4,112 @@
 
 """This script loads and preprocesses the complaints data and exports to processed data folder.
 
-Usage: load_preprocess_data.py --raw_path=<raw_path> --output_path=<output_path>
+Usage: load_preprocess_data.py --raw_path=<raw_path> --output_path=<output_path> [--ipc_path=<ipc_path>]
 Options:
 --raw_path=<raw_path>       This is the path to the raw complaints data
 --output_path=<output_path> This is the path to where the processed data should be saved
+                            as parquet if it ends in .parquet, otherwise as csv
+--ipc_path=<ipc_path>       Optional path to also save the processed data as an arrow
+                            ipc stream (.arrows) for memory mapped loads, parquet only
 """
 
 from docopt import docopt
-from typing import Union
+from typing import List, Optional, Union
+import csv
+import re
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    from pyarrow import compute as pc
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+except ImportError:  # fall back to the pandas C parser
+    pa = None
+
+# column types of the raw CFPB file for the arrow reader, declared up front so the
+# types can't change between blocks when the file is streamed
+RAW_ARROW_COLUMN_TYPES = {
+    "Date received": "timestamp[s]",
+    "Date sent to company": "timestamp[s]",
+    "Consumer complaint narrative": "string",
+    "ZIP code": "string",
+    "Consumer consent provided?": "string",
+    "Consumer disputed?": "string",
+    "Complaint ID": "int64",
+}
+
+# spaces and dashes in the raw column names become underscores
+_COLUMN_NAME_SEPARATORS = re.compile(r"[ \-]")
+
+
+def _clean_column_name(col: str) -> str:
+    """Converts a raw column name like "Consumer disputed?" to "consumer_disputed"."""
+    return _COLUMN_NAME_SEPARATORS.sub("_", col.lower()).replace("?", "")
+
+
+def _read_csv_header(file_path: str) -> List[str]:
+    """Reads only the column names from the first line of a csv."""
+    with open(file_path, newline="") as csv_file:
+        return next(csv.reader(csv_file))
+
+
+def _check_columns(columns: List[str], file_columns: List[str]) -> None:
+    """Raises a ValueError for an empty or repeated selection or unknown columns."""
+
+    # pyarrow reads an empty include_columns as every column
+    if len(columns) == 0:
+        raise ValueError("Expected at least one column, got an empty list")
+
+    repeated_columns = sorted({col for col in columns if columns.count(col) > 1})
+    if repeated_columns:
+        raise ValueError(f"Columns {repeated_columns} are selected more than once")
+
+    unknown_columns = [col for col in columns if col not in file_columns]
+    if unknown_columns:
+        raise ValueError(
+            f"Columns {unknown_columns} not found, expected any of {file_columns}"
+        )
+
+
+# known data types of the raw CFPB file so pandas parses them in a single pass,
+# zip codes have mixed int/string values and are coerced after reading in.
+# Low cardinality columns are categories so they're dictionary encoded in parquet
+RAW_COLUMN_DTYPES = {
+    "Product": "category",
+    "Sub-product": "category",
+    "Issue": "category",
+    "Sub-issue": "category",
+    "Company public response": "category",
+    "Company": "category",
+    "State": "category",
+    "ZIP code": object,
+    "Tags": "category",
+    "Submitted via": "category",
+    "Company response to consumer": "category",
+    "Timely response?": "category",
+    "Consumer disputed?": "category",
+}
+RAW_DATE_COLUMNS = ["Date received", "Date sent to company"]
+
+PROCESSED_COLUMN_DTYPES = {
+    _clean_column_name(col): dtype for col, dtype in RAW_COLUMN_DTYPES.items()
+}
+PROCESSED_DATE_COLUMNS = [_clean_column_name(col) for col in RAW_DATE_COLUMNS]
+
+# valid zip codes are five digits, anything else like the masked "123XX" is missing
+_ZIP_CODE_PATTERN = r"^\d{5}$"
+
+# text is stored as arrow strings, or python strings if pyarrow isn't installed
+_TEXT_DTYPE = pd.StringDtype("pyarrow" if pa is not None else "python")
+
 
 def load_and_preprocess_raw_complaints_data(
-    file_path: str, num_rows: Union[str, int] = "all", skip_rows: int = 0
+    file_path: str,
+    num_rows: Union[str, int] = "all",
+    skip_rows: int = 0,
+    columns: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """Reads in complaints data and cleans up names and data types.
 
@@ -29,6 +122,9 @@ def load_and_preprocess_raw_complaints_data(
         dataset is read in, by default "all"
     skip_rows : int, optional
         How many rows to skip from the start of the file, by default 0
+    columns : list of str, optional
+        Cleaned names of the columns to read in, returned in the given order,
+        other columns aren't parsed at all, by default None for all columns
 
     Returns
     -------
@@ -38,7 +134,7 @@ def load_and_preprocess_raw_complaints_data(
     Raises
     ------
     ValueError
-        Incorrect data types passed in for parameters.
+        Incorrect data types passed in for parameters, or unknown columns.
 
     Example
     -------
@@ -49,68 +145,289 @@ def load_and_preprocess_raw_complaints_data(
     raw_df = load_raw_complaints_data(
         os.path.join(os.pardir, "data", "raw", "complaints.csv"),
         num_rows = 200000,
-        skip_rows=100000
+        skip_rows=100000,
+        columns=["date_received", "consumer_disputed"],
     )
     """
 
-    # tell pandas we know there are mixed int/string values in these columns
-    # these are coerced after reading in
-    col_dtype_corrections = {"ZIP code": object, "Consumer disputed?": object}
+    if type(file_path) is not str:
+        raise ValueError(f"Expected file_path as string, got {type(file_path)}")
 
-    if num_rows == "all":
-        raw_complaint_df = pd.read_csv(file_path, dtype=col_dtype_corrections)
-    elif (type(num_rows) == int) & (type(skip_rows) == int):
-        raw_complaint_df = pd.read_csv(
-            file_path,
-            dtype=col_dtype_corrections,
-            header=0,
-            nrows=num_rows,
-            skiprows=range(1, skip_rows + 1),  # ensure header remains for column names
-        )
-    else:
+    if not ((num_rows == "all") or (type(num_rows) == int)) or (
+        type(skip_rows) != int
+    ):
         raise ValueError(
             f"Expected num_rows as 'all' or integer and skip_rows as "
             f"integrer, got {type(num_rows)} and {type(skip_rows)}"
         )
 
-    raw_complaint_df.columns = (
-        raw_complaint_df.columns.str.lower()
-        .str.replace(" ", "_")
-        .str.replace("?", "", regex=False)
-        .str.replace("-", "_")
+    if columns is not None:
+        _check_columns(
+            columns, [_clean_column_name(col) for col in _read_csv_header(file_path)]
+        )
+
+    if pa is not None:
+        raw_complaint_df = _read_raw_complaints_arrow(
+            file_path, num_rows, skip_rows, columns
+        )
+    else:
+        raw_complaint_df = _read_raw_complaints_pandas(
+            file_path, num_rows, skip_rows, columns
+        )
+
+    return raw_complaint_df
+
+
+def _csv_options(
+    column_types: dict,
+    skip_rows: int = 0,
+    include_columns: Optional[List[str]] = None,
+) -> tuple:
+    """Builds the pyarrow read, parse and convert options for a complaints csv."""
+
+    read_options = pa_csv.ReadOptions(
+        block_size=32 << 20, use_threads=True, skip_rows_after_names=skip_rows
+    )
+    # complaint narratives contain quoted line breaks
+    parse_options = pa_csv.ParseOptions(delimiter=",", newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(
+        column_types=column_types,
+        strings_can_be_null=True,  # match pandas, empty strings are missing values
+        include_columns=include_columns,  # None reads every column
+    )
+
+    return read_options, parse_options, convert_options
+
+
+def _raw_column_types() -> dict:
+    """Returns the pyarrow column types of the raw complaints csv."""
+
+    # categorical columns are dictionary encoded by the parser
+    column_types = dict(RAW_ARROW_COLUMN_TYPES)
+    for col, dtype in RAW_COLUMN_DTYPES.items():
+        if dtype == "category":
+            column_types[col] = pa.dictionary(pa.int32(), pa.string())
+
+    return column_types
+
+
+def _read_csv_arrow(
+    file_path: str, num_rows: Union[str, int], options: tuple
+) -> "pa.Table":
+    """Reads a csv into an arrow table, only parsing the blocks needed for num_rows."""
+
+    read_options, parse_options, convert_options = options
+    if num_rows == "all":
+        return pa_csv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    )
+    batches = []
+    rows_read = 0
+    for batch in reader:
+        batches.append(batch)
+        rows_read += batch.num_rows
+        if rows_read >= num_rows:
+            break
+
+    return pa.Table.from_batches(batches, schema=reader.schema).slice(0, num_rows)
+
+
+def _read_raw_complaints_arrow(
+    file_path: str,
+    num_rows: Union[str, int],
+    skip_rows: int,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Reads the raw complaints csv with the multi-threaded pyarrow parser.
+
+    Dates and categories are typed by the reader, and columns are renamed and
+    zip codes coerced on the arrow table before handing it to pandas.
+    """
+
+    include_columns = None
+    if columns is not None:
+        # the parser selects columns by their raw names, found from the header
+        raw_columns = {
+            _clean_column_name(col): col for col in _read_csv_header(file_path)
+        }
+        include_columns = [raw_columns[col] for col in columns]
+
+    options = _csv_options(_raw_column_types(), skip_rows, include_columns)
+    table = _read_csv_arrow(file_path, num_rows, options)
+    table = table.rename_columns(
+        [_clean_column_name(col) for col in table.column_names]
     )
+    zip_index = table.schema.get_field_index("zip_code")
+    if zip_index != -1:
+        table = table.set_column(
+            zip_index, "zip_code", _coerce_zip_codes_arrow(table.column(zip_index))
+        )
 
-    # basic first infer of object_types
-    raw_complaint_df = raw_complaint_df.infer_objects()
+    # text is stored as strings and zip codes as nullable integers, dates and ids
+    # stay numpy backed, the same types as every other reader
+    return table.to_pandas(
+        types_mapper={pa.string(): _TEXT_DTYPE, pa.int32(): pd.Int32Dtype()}.get,
+        self_destruct=True,
+    )
 
-    # any columns with date in the name converted to datetime
-    for col in [col for col in raw_complaint_df.columns if "date" in col]:
-        raw_complaint_df[col] = pd.to_datetime(raw_complaint_df[col])
 
-    # zip code column has non-permissable values, convert to numeric and NAN for bad vlaues
-    raw_complaint_df.zip_code = pd.to_numeric(
-        raw_complaint_df.zip_code,
-        errors="coerce",
-        downcast="integer",  # get into smallest data format
+def _read_raw_complaints_pandas(
+    file_path: str,
+    num_rows: Union[str, int],
+    skip_rows: int,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Reads the raw complaints csv with pandas when pyarrow isn't installed."""
+
+    # header is read separately so skipped rows are a plain offset
+    header = _read_csv_header(file_path)
+    usecols = header
+    if columns is not None:
+        # columns are selected by their raw names
+        raw_columns = {_clean_column_name(col): col for col in header}
+        usecols = [raw_columns[col] for col in columns]
+
+    raw_complaint_df = pd.read_csv(
+        file_path,
+        usecols=usecols,
+        dtype=RAW_COLUMN_DTYPES,
+        parse_dates=[col for col in RAW_DATE_COLUMNS if col in usecols],
+        date_format="%Y-%m-%d",
+        header=None,
+        names=header,
+        skiprows=skip_rows + 1,
+        nrows=None if num_rows == "all" else num_rows,
     )
 
+    raw_complaint_df.columns = [
+        _clean_column_name(col) for col in raw_complaint_df.columns
+    ]
+
+    # zip code column has non-permissable values, only five digit codes are kept
+    if "zip_code" in raw_complaint_df:
+        zip_codes = raw_complaint_df.zip_code
+        valid = zip_codes.str.match(_ZIP_CODE_PATTERN, na=False).to_numpy()
+        values = np.zeros(len(zip_codes), dtype=np.int32)
+        values[valid] = zip_codes[valid].astype(np.int32)
+        raw_complaint_df.zip_code = pd.arrays.IntegerArray(values, mask=~valid)
+
+    for col in raw_complaint_df.select_dtypes("object"):
+        raw_complaint_df[col] = raw_complaint_df[col].astype(_TEXT_DTYPE)
+
+    # usecols keeps the file's column order
+    if columns is not None:
+        raw_complaint_df = raw_complaint_df[columns]
+
     return raw_complaint_df
 
 
+def preprocess_raw_complaints_to_parquet(
+    file_path: str, output_path: str, ipc_path: Optional[str] = None
+) -> None:
+    """Streams the raw complaints csv into a processed parquet file.
+
+    The csv is parsed and cleaned one block at a time, so memory use doesn't
+    grow with the size of the file. The result is the same as saving the data
+    frame from load_and_preprocess_raw_complaints_data to parquet.
+
+    Parameters
+    ----------
+    file_path : string
+        Relative location of the "complaints.csv" file
+    output_path : string
+        Where to save the processed parquet file
+    ipc_path : string, optional
+        Where to also save the processed data as an arrow ipc stream, which can
+        be memory mapped by load_processed_complaints_data, by default None
+
+    Raises
+    ------
+    ImportError
+        pyarrow isn't installed.
+
+    Example
+    -------
+    preprocess_raw_complaints_to_parquet(
+        os.path.join(os.pardir, "data", "raw", "complaints.csv"),
+        os.path.join(os.pardir, "data", "processed", "preprocessed-complaints.parquet"),
+    )
+    """
+
+    if pa is None:
+        raise ImportError("pyarrow is required to write parquet files")
+
+    read_options, parse_options, convert_options = _csv_options(_raw_column_types())
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    )
+
+    schema = pa.schema(
+        [field.with_name(_clean_column_name(field.name)) for field in reader.schema]
+    )
+    zip_index = schema.get_field_index("zip_code")
+    schema = schema.set(zip_index, pa.field("zip_code", pa.int32()))
+
+    # the ipc stream format is used as every block has its own category
+    # dictionaries, which the ipc file format doesn't allow
+    ipc_writer = pa.ipc.new_stream(ipc_path, schema) if ipc_path else None
+    try:
+        with pa_parquet.ParquetWriter(
+            output_path, schema, compression="snappy"
+        ) as writer:
+            for batch in reader:
+                columns = batch.columns
+                columns[zip_index] = _coerce_zip_codes_arrow(columns[zip_index])
+                batch = pa.RecordBatch.from_arrays(columns, schema=schema)
+                writer.write_batch(batch)
+                if ipc_writer is not None:
+                    ipc_writer.write_batch(batch)
+    finally:
+        if ipc_writer is not None:
+            ipc_writer.close()
+
+
+def _coerce_zip_codes_arrow(zip_codes: "pa.Array") -> "pa.Array":
+    """Converts arrow zip code strings to int32, bad values become missing."""
+
+    # only the five digit codes are cast so the cast can't fail
+    valid = pc.match_substring_regex(zip_codes, _ZIP_CODE_PATTERN)
+    return pc.cast(pc.if_else(valid, zip_codes, None), pa.int32())
+
+
 def load_processed_complaints_data(
-    file_path: str, num_rows: Union[str, int] = "all", skip_rows: int = 0
+    file_path: str,
+    num_rows: Union[str, int] = "all",
+    skip_rows: int = 0,
+    columns: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """Reads in the processed complaints data and cleans up names and data types.
 
     Parameters
     ----------
     file_path : string
-        Relative location of the "complaints.csv" file
+        Relative location of the processed complaints file, either a ".parquet",
+        arrow ipc stream ".arrows" or ".csv" file
     num_rows : int, optional
-        How many rows of the csv to read in to help speed up analysis. If all entire
+        How many rows of the file to read in to help speed up analysis. If all entire
         dataset is read in, by default "all"
     skip_rows : int, optional
         How many rows to skip from the start of the file, by default 0
+    columns : list of str, optional
+        Names of the columns to read in, returned in the given order, other
+        columns aren't read at all, by default None for all columns
 
     Returns
     -------
@@ -120,71 +437,177 @@ def load_processed_complaints_data(
     Raises
     ------
     ValueError
-        Incorrect data types passed in for parameters.
+        Incorrect data types passed in for parameters, or unknown columns.
+    ImportError
+        A parquet or arrow ipc file is read without pyarrow installed.
 
     Example
     -------
     processed_df = load_processed_complaints_data(
-        os.path.join(os.pardir, "data", "processed", "preprocessed-complaints.csv")
+        os.path.join(os.pardir, "data", "processed", "preprocessed-complaints.parquet")
     )
     # OR
     processed_df = load_processed_complaints_data(
-        os.path.join(os.pardir, "data", "processed", "preprocessed-complaints.csv"),
+        os.path.join(os.pardir, "data", "processed", "preprocessed-complaints.parquet"),
         num_rows = 200000,
-        skip_rows=100000
+        skip_rows=100000,
+        columns=["date_received", "consumer_disputed"],
     )
     """
 
     if type(file_path) is not str:
         raise ValueError(f"Expected file_path as string, got {type(file_path)}")
 
-    # tell pandas we know there are mixed int/string values in these columns
-    # these are coerced after reading in
-    col_dtype_corrections = {"zip_code": object, "consumer_disputed": object}
-
-    if num_rows == "all":
-        processed_df = pd.read_csv(file_path, dtype=col_dtype_corrections)
-    elif (type(num_rows) == int) & (type(skip_rows) == int):
-        processed_df = pd.read_csv(
-            file_path,
-            dtype=col_dtype_corrections,
-            header=0,
-            nrows=num_rows,
-            skiprows=range(1, skip_rows + 1),  # ensure header remains
-        )
-    else:
+    if not ((num_rows == "all") or (type(num_rows) == int)) or (
+        type(skip_rows) != int
+    ):
         raise ValueError(
             f"Expected num_rows as 'all' or integer and skip_rows as "
             f"integrer, got {type(num_rows)} and {type(skip_rows)}"
         )
 
-    # basic first infer of object_types
-    processed_df = processed_df.infer_objects()
+    if file_path.endswith((".parquet", ".arrows")):
+        if pa is None:
+            raise ImportError("pyarrow is required to read parquet and arrow ipc files")
 
-    # any columns with date in the name converted to datetime
-    for col in [col for col in processed_df.columns if "date" in col]:
-        processed_df[col] = pd.to_datetime(processed_df[col])
+        if file_path.endswith(".parquet"):
+            if columns is not None:
+                _check_columns(columns, pa_parquet.read_schema(file_path).names)
+            table = pa_parquet.read_table(file_path, columns=columns)
+        else:
+            # memory mapped, columns and rows are selected without copying
+            table = pa.ipc.open_stream(pa.memory_map(file_path, "r")).read_all()
+            if columns is not None:
+                _check_columns(columns, table.column_names)
+                table = table.select(columns)
 
-    # zip code column has non-permissable values, convert to numeric and NAN for bad vlaues
-    processed_df.zip_code = pd.to_numeric(
-        processed_df.zip_code,
-        errors="coerce",
-        downcast="integer",  # get into smallest data format
+        table = table.slice(skip_rows, None if num_rows == "all" else num_rows)
+
+        # both formats keep the data types so no further parsing is needed
+        return _processed_table_to_pandas(table)
+
+    if columns is not None:
+        _check_columns(columns, _read_csv_header(file_path))
+
+    if pa is not None:
+        return _read_processed_complaints_arrow(file_path, num_rows, skip_rows, columns)
+
+    return _read_processed_complaints_pandas(file_path, num_rows, skip_rows, columns)
+
+
+def _read_processed_complaints_arrow(
+    file_path: str,
+    num_rows: Union[str, int],
+    skip_rows: int,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Reads a processed complaints csv with the multi-threaded pyarrow parser."""
+
+    # same types as the raw file, except zip codes which are already numbers
+    column_types = {
+        _clean_column_name(col): col_type
+        for col, col_type in _raw_column_types().items()
+    }
+    column_types["zip_code"] = pa.float64()
+
+    options = _csv_options(column_types, skip_rows, columns)
+    table = _read_csv_arrow(file_path, num_rows, options)
+    zip_index = table.schema.get_field_index("zip_code")
+    if zip_index != -1:
+        # read as floats so files saved with decimal zip codes still load
+        table = table.set_column(
+            zip_index, "zip_code", pc.cast(table.column(zip_index), pa.int32())
+        )
+
+    return _processed_table_to_pandas(table)
+
+
+def _processed_table_to_pandas(table: "pa.Table") -> pd.DataFrame:
+    """Converts a processed complaints table into a compact data frame."""
+
+    # the pandas metadata is ignored so other columns stay numpy backed
+    processed_df = table.to_pandas(
+        ignore_metadata=True,
+        types_mapper={pa.string(): _TEXT_DTYPE, pa.int32(): pd.Int32Dtype()}.get,
     )
 
+    return _compact_processed_df(processed_df)
+
+
+def _compact_processed_df(processed_df: pd.DataFrame) -> pd.DataFrame:
+    """Sets the final data types of processed complaints from any reader.
+
+    Text columns become strings instead of python objects and int64 columns
+    are downcast to the smallest type that holds their values, so the types
+    don't depend on the file format or whether pyarrow is installed. Zip codes
+    are left as nullable int32 like the raw loader returns them.
+    """
+
+    for col in processed_df.select_dtypes("object"):
+        processed_df[col] = processed_df[col].astype(_TEXT_DTYPE)
+    for col in processed_df.select_dtypes(np.int64):
+        processed_df[col] = pd.to_numeric(processed_df[col], downcast="integer")
+
     return processed_df
 
 
+def _read_processed_complaints_pandas(
+    file_path: str,
+    num_rows: Union[str, int],
+    skip_rows: int,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Reads a processed complaints csv with pandas when pyarrow isn't installed."""
+
+    date_columns = PROCESSED_DATE_COLUMNS
+    if columns is not None:
+        date_columns = [col for col in PROCESSED_DATE_COLUMNS if col in columns]
+
+    # dates may have been saved with a time component
+    processed_df = pd.read_csv(
+        file_path,
+        usecols=columns,
+        dtype=PROCESSED_COLUMN_DTYPES,
+        parse_dates=date_columns,
+        date_format="ISO8601",
+        header=None,
+        names=_read_csv_header(file_path),
+        skiprows=skip_rows + 1,
+        nrows=None if num_rows == "all" else num_rows,
+    )
+
+    # zip code column has non-permissable values, convert to numeric and NA for bad vlaues
+    if "zip_code" in processed_df:
+        processed_df.zip_code = pd.to_numeric(
+            processed_df.zip_code, errors="coerce"
+        ).astype(pd.Int32Dtype())
+
+    # usecols keeps the file's column order
+    if columns is not None:
+        processed_df = processed_df[columns]
+
+    return _compact_processed_df(processed_df)
+
+
 def main():
 
     opt = docopt(__doc__)
     raw_file_path = opt["--raw_path"]
     output_file_path = opt["--output_path"]
+    ipc_file_path = opt["--ipc_path"]
 
-    print("Loading and preprocessing raw complaints data...")
-    preprocessed_df = load_and_preprocess_raw_complaints_data(file_path=raw_file_path)
-    print("Done preprocessing, saving results....")
-    preprocessed_df.to_csv(output_file_path, index=False)
+    if output_file_path.endswith(".parquet"):
+        print("Preprocessing raw complaints data and saving in batches...")
+        preprocess_raw_complaints_to_parquet(
+            raw_file_path, output_file_path, ipc_path=ipc_file_path
+        )
+    else:
+        print("Loading and preprocessing raw complaints data...")
+        preprocessed_df = load_and_preprocess_raw_complaints_data(
+            file_path=raw_file_path
+        )
+        print("Done preprocessing, saving results....")
+        preprocessed_df.to_csv(output_file_path, index=False)
     print(f"Completed preprocessing successfully, data saved to: {output_file_path}")
 
 
@@ -12,7 +12,7 @@ if src_path not in sys.path:
 from sklearn.pipeline import Pipeline
 from src.analysis.analysis import *
 
-data_filepath = 'data/processed/preprocessed-complaints.csv'
+data_filepath = 'data/processed/preprocessed-complaints.parquet'
 # load data set
 complaints_df = load_processed_complaints_data(data_filepath)
 complaints_df = complaints_df.query("not consumer_disputed.isnull()")
@@ -2,6 +2,7 @@ import os
 import sys
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 import altair as alt
 
@@ -17,10 +18,15 @@ if src_path not in sys.path:
 from src.data.load_preprocess_data import load_processed_complaints_data
 from src.data.generate_eda import gen_unique_null_table
 from src.data.generate_eda import plot_missing_values
+from src.data.generate_eda import plot_complaints_over_time
+from src.data.generate_eda import count_valid_unique
+from src.data.generate_eda import read_last_complaints
+from src.data.generate_eda import main
 
 # Loading the data for testing
 raw_data_path = os.path.join("data", "raw", "complaints.csv")
-train = os.path.join("data", "processed", "preprocessed-complaints.csv")
+train = os.path.join("data", "processed", "preprocessed-complaints.parquet")
+train_ipc = os.path.join("data", "processed", "preprocessed-complaints.arrows")
 complaints_df = load_processed_complaints_data(train)
 
 
@@ -47,3 +53,69 @@ def test_return_plot():
     actual = type(alt.Chart())
     returned = type(plot_missing_values(complaints_df, 200))
     assert actual == returned
+
+@pytest.mark.parametrize("path", [train, train_ipc])
+def test_read_last_complaints(path):
+    """
+    Checks the last complaints are read and indexed by their row in the file
+    """
+    recent_df = read_last_complaints(path, 200)
+    expected_df = complaints_df.tail(200)
+
+    assert recent_df.index.equals(expected_df.index)
+    assert recent_df.complaint_id.tolist() == expected_df.complaint_id.tolist()
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        pa.chunked_array([[1, 2, None], [2, 3, None]]),
+        pa.chunked_array([["a", None, "b"], ["b", "c"]]),
+        # each chunk has its own dictionary like a streamed file
+        pa.chunked_array(
+            [
+                pa.array(["a", None, "b"]).dictionary_encode(),
+                pa.array(["c", "b"]).dictionary_encode(),
+            ]
+        ),
+        pa.chunked_array([pa.nulls(3)]),
+    ],
+)
+def test_count_valid_unique(column):
+    """
+    Checks the arrow counts match pandas count() and nunique()
+    """
+    series = column.to_pandas()
+    assert count_valid_unique(column) == (series.count(), series.nunique())
+
+def test_plot_complaints_without_dates():
+    """
+    Checks complaints without any received dates still return an empty chart
+    """
+    no_dates_df = pd.DataFrame({"date_received": pd.to_datetime([None, None])})
+    chart = plot_complaints_over_time(no_dates_df)
+    assert type(chart) == type(alt.Chart())
+    assert len(chart.data) == 0
+
+def test_unique_table_mixed_types():
+    """
+    Checks columns arrow can't convert are still counted like pandas
+    """
+    mixed_df = pd.DataFrame({"mixed": [1, "x", None, "x"], "number": [1, 2, 2, None]})
+    unique_df = gen_unique_null_table(mixed_df)
+    assert unique_df["valid_count"].tolist() == [3, 3]
+    assert unique_df["unique_count"].tolist() == [2, 2]
+
+@pytest.mark.parametrize("path", ["preprocessed-complaints.csv", "complaints.txt"])
+def test_read_last_complaints_unsupported_file(path):
+    """
+    Checks files that can't be read from the end raise a ValueError
+    """
+    with pytest.raises(ValueError):
+        read_last_complaints(path, 200)
+
+def test_main_unsupported_file():
+    """
+    Checks train data in an unknown format raises a ValueError
+    """
+    with pytest.raises(ValueError):
+        main("preprocessed-complaints.txt", None)
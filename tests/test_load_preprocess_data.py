@@ -1,3 +1,5 @@
+import csv
+import itertools
 import os
 import sys
 
@@ -11,13 +13,62 @@ src_path = cur_dir[
 if src_path not in sys.path:
     sys.path.append(src_path)
 
+from src.data import load_preprocess_data
 from src.data.load_preprocess_data import (
     load_and_preprocess_raw_complaints_data,
     load_processed_complaints_data,
+    preprocess_raw_complaints_to_parquet,
 )
 
 raw_data_path = os.path.join("data", "raw", "complaints.csv")
-processed_data_path = os.path.join("data", "processed", "preprocessed-complaints.csv")
+processed_data_path = os.path.join("data", "processed", "preprocessed-complaints.parquet")
+processed_ipc_path = os.path.join("data", "processed", "preprocessed-complaints.arrows")
+
+
+# csv files are read by pyarrow when installed, otherwise by the pandas fallbacks
+csv_readers = ["pyarrow", "pandas"]
+
+
+def use_csv_reader(csv_reader, monkeypatch):
+
+    if csv_reader == "pandas":
+        monkeypatch.setattr(load_preprocess_data, "pa", None)
+
+
+# a small copy of the first raw complaints, so whole files can be processed quickly
+@pytest.fixture(scope="module")
+def raw_sample_path(tmp_path_factory):
+
+    sample_path = tmp_path_factory.mktemp("raw") / "complaints.csv"
+    with open(raw_data_path, newline="") as raw_file, open(
+        sample_path, "w", newline=""
+    ) as sample_file:
+        writer = csv.writer(sample_file)
+        writer.writerows(itertools.islice(csv.reader(raw_file), 1001))
+
+    return str(sample_path)
+
+
+@pytest.fixture(scope="module")
+def processed_sample_paths(raw_sample_path, tmp_path_factory):
+
+    processed_dir = tmp_path_factory.mktemp("processed")
+    parquet_path = str(processed_dir / "preprocessed-complaints.parquet")
+    ipc_path = str(processed_dir / "preprocessed-complaints.arrows")
+    preprocess_raw_complaints_to_parquet(raw_sample_path, parquet_path, ipc_path)
+
+    return parquet_path, ipc_path
+
+
+@pytest.fixture(scope="module")
+def processed_sample_csv_path(raw_sample_path, tmp_path_factory):
+
+    csv_path = str(tmp_path_factory.mktemp("processed") / "preprocessed-complaints.csv")
+    load_and_preprocess_raw_complaints_data(raw_sample_path).to_csv(
+        csv_path, index=False
+    )
+
+    return csv_path
 
 """DATA LOADING TESTS"""
 
@@ -54,9 +105,11 @@ def test_processed_row_selection_options(nrows):
 
 # test that skipping first rows of dataframes returns the same data at the first
 # row of the dataframe
+@pytest.mark.parametrize("csv_reader", csv_readers)
 @pytest.mark.parametrize("skip_rows", [(1), (100), (999)])
-def test_raw_skip_row_selection_options(skip_rows):
+def test_raw_skip_row_selection_options(skip_rows, csv_reader, monkeypatch):
 
+    use_csv_reader(csv_reader, monkeypatch)
     no_skip_df = load_and_preprocess_raw_complaints_data(raw_data_path, num_rows=1000)
     skip_rows_df = load_and_preprocess_raw_complaints_data(
         raw_data_path, num_rows=1000, skip_rows=skip_rows
@@ -76,6 +129,171 @@ def test_processed_skip_row_selection_options(skip_rows):
     assert no_skip_df.complaint_id.iloc[skip_rows] == skip_rows_df.complaint_id.iloc[0]
 
 
+# Test that the streamed parquet file holds the same data as the raw loader returns
+def test_streamed_parquet_matches_raw_load(raw_sample_path, processed_sample_paths):
+
+    raw_df = load_and_preprocess_raw_complaints_data(raw_sample_path)
+    processed_df = load_processed_complaints_data(processed_sample_paths[0])
+
+    # processed complaint ids are downcast, and category order depends on the reader
+    raw_df = raw_df.astype({"complaint_id": processed_df.complaint_id.dtype})
+    pd.testing.assert_frame_equal(processed_df, raw_df, check_categorical=False)
+
+
+# Test that the arrow ipc stream reads the same rows as the parquet file
+@pytest.mark.parametrize(
+    "num_rows, skip_rows", [("all", 0), ("all", 10), (100, 0), (100, 10)]
+)
+def test_processed_ipc_matches_parquet(processed_sample_paths, num_rows, skip_rows):
+
+    parquet_path, ipc_path = processed_sample_paths
+    parquet_df = load_processed_complaints_data(
+        parquet_path, num_rows=num_rows, skip_rows=skip_rows
+    )
+    ipc_df = load_processed_complaints_data(
+        ipc_path, num_rows=num_rows, skip_rows=skip_rows
+    )
+
+    pd.testing.assert_frame_equal(ipc_df, parquet_df)
+
+
+# Test that a processed csv reads the same rows and columns as the parquet file
+@pytest.mark.parametrize(
+    "num_rows, skip_rows, columns",
+    [
+        ("all", 0, None),
+        ("all", 10, None),
+        (100, 10, None),
+        (100, 0, ["zip_code", "consumer_complaint_narrative", "date_received"]),
+    ],
+)
+@pytest.mark.parametrize("csv_reader", csv_readers)
+def test_processed_csv_matches_parquet(
+    processed_sample_csv_path,
+    processed_sample_paths,
+    num_rows,
+    skip_rows,
+    columns,
+    csv_reader,
+    monkeypatch,
+):
+
+    parquet_df = load_processed_complaints_data(
+        processed_sample_paths[0],
+        num_rows=num_rows,
+        skip_rows=skip_rows,
+        columns=columns,
+    )
+    use_csv_reader(csv_reader, monkeypatch)
+    csv_df = load_processed_complaints_data(
+        processed_sample_csv_path,
+        num_rows=num_rows,
+        skip_rows=skip_rows,
+        columns=columns,
+    )
+
+    # category order depends on the reader
+    pd.testing.assert_frame_equal(csv_df, parquet_df, check_categorical=False)
+
+
+# Test that the pandas fallback reads the raw file the same as pyarrow, including
+# the skipped rows, parsed dates, coerced zip codes and selected columns
+@pytest.mark.parametrize(
+    "num_rows, skip_rows, columns",
+    [
+        ("all", 0, None),
+        ("all", 10, None),
+        (100, 10, None),
+        (100, 0, ["zip_code", "consumer_complaint_narrative", "date_received"]),
+    ],
+)
+def test_raw_pandas_reader_matches_pyarrow(
+    raw_sample_path, num_rows, skip_rows, columns, monkeypatch
+):
+
+    pyarrow_df = load_and_preprocess_raw_complaints_data(
+        raw_sample_path, num_rows=num_rows, skip_rows=skip_rows, columns=columns
+    )
+    use_csv_reader("pandas", monkeypatch)
+    pandas_df = load_and_preprocess_raw_complaints_data(
+        raw_sample_path, num_rows=num_rows, skip_rows=skip_rows, columns=columns
+    )
+
+    # category order depends on the reader
+    pd.testing.assert_frame_equal(pandas_df, pyarrow_df, check_categorical=False)
+
+
+# Test that only five digit zip codes are kept, anything else is missing
+@pytest.mark.parametrize("csv_reader", csv_readers)
+def test_zip_codes_coerced(tmp_path, csv_reader, monkeypatch):
+
+    zip_codes = ["12345", "02134", "123XX", "1234", "123456", ""]
+    with open(raw_data_path, newline="") as raw_file:
+        header = next(csv.reader(raw_file))
+
+    raw_path = str(tmp_path / "complaints.csv")
+    with open(raw_path, "w", newline="") as zip_file:
+        writer = csv.DictWriter(zip_file, fieldnames=header)
+        writer.writeheader()
+        for i, zip_code in enumerate(zip_codes):
+            writer.writerow({"ZIP code": zip_code, "Complaint ID": i})
+
+    parquet_path = str(tmp_path / "preprocessed-complaints.parquet")
+    preprocess_raw_complaints_to_parquet(raw_path, parquet_path)
+    parquet_df = load_processed_complaints_data(parquet_path)
+
+    use_csv_reader(csv_reader, monkeypatch)
+    raw_df = load_and_preprocess_raw_complaints_data(raw_path)
+
+    for zip_df in [raw_df, parquet_df]:
+        assert zip_df.zip_code.isna().tolist() == [False, False, True, True, True, True]
+        assert zip_df.zip_code.iloc[:2].tolist() == [12345, 2134]
+
+
+"""COLUMN SELECTION TESTS"""
+
+# Test that only the requested columns are returned, in the requested order
+@pytest.mark.parametrize(
+    "load_data, file_path, csv_reader",
+    [
+        (load_and_preprocess_raw_complaints_data, raw_data_path, "pyarrow"),
+        (load_and_preprocess_raw_complaints_data, raw_data_path, "pandas"),
+        (load_processed_complaints_data, processed_data_path, "pyarrow"),
+        (load_processed_complaints_data, processed_ipc_path, "pyarrow"),
+    ],
+)
+def test_column_selection(load_data, file_path, csv_reader, monkeypatch):
+
+    use_csv_reader(csv_reader, monkeypatch)
+    columns = ["consumer_disputed", "date_received", "zip_code"]
+    selected_df = load_data(file_path, num_rows=100, columns=columns)
+
+    assert list(selected_df.columns) == columns
+    assert len(selected_df) == 100
+
+
+# Test that a column name not in the file raises a ValueError
+@pytest.mark.parametrize(
+    "load_data, file_path, csv_reader",
+    [
+        (load_and_preprocess_raw_complaints_data, raw_data_path, "pyarrow"),
+        (load_and_preprocess_raw_complaints_data, raw_data_path, "pandas"),
+        (load_processed_complaints_data, processed_data_path, "pyarrow"),
+        (load_processed_complaints_data, processed_ipc_path, "pyarrow"),
+    ],
+)
+@pytest.mark.parametrize(
+    "columns", [["date_recieved"], [], ["date_received", "date_received"]]
+)
+def test_unknown_column_selection(
+    load_data, file_path, csv_reader, columns, monkeypatch
+):
+
+    use_csv_reader(csv_reader, monkeypatch)
+    with pytest.raises(ValueError):
+        load_data(file_path, columns=columns)
+
+
 """FILE PATH TESTS"""
 
 # Test that a non-existent file path raises a FileNotFoundError
@@ -110,3 +328,21 @@ def test_processed_incorrect_file_path_type(file_path):
 
     with pytest.raises(ValueError):
         preprocessed_df = load_processed_complaints_data(file_path)
+
+
+# Test that reading or writing arrow formats without pyarrow raises an ImportError
+@pytest.mark.parametrize("file_path", [processed_data_path, processed_ipc_path])
+def test_processed_load_without_pyarrow(file_path, monkeypatch):
+
+    monkeypatch.setattr(load_preprocess_data, "pa", None)
+    with pytest.raises(ImportError):
+        preprocessed_df = load_processed_complaints_data(file_path)
+
+
+def test_parquet_preprocess_without_pyarrow(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(load_preprocess_data, "pa", None)
+    with pytest.raises(ImportError):
+        preprocess_raw_complaints_to_parquet(
+            raw_data_path, str(tmp_path / "preprocessed-complaints.parquet")
+        )